@@ -15,13 +15,17 @@ player has guessed all of the letters in the word, the code prints a message con
 all of their chances and has not correctly guessed the word, the code prints a message informing the player that they lost and reveals the word.
  """
  
-# Import the random module
+# Import the random and string modules
 import random
+import string
 
-# List of fruits that can be used as secret words in the game
-FRUITS = ['apple', 'banana', 'mango', 'strawberry', 'orange', 'grape', 'pineapple',
+# Set of valid guesses: single lowercase ASCII letters
+LETTERS = frozenset(string.ascii_lowercase)
+
+# Tuple of fruits that can be used as secret words in the game
+FRUITS = ('apple', 'banana', 'mango', 'strawberry', 'orange', 'grape', 'pineapple',
           'apricot', 'lemon', 'coconut', 'watermelon', 'cherry', 'papaya', 'berry',
-          'peach', 'lychee', 'muskmelon']
+          'peach', 'lychee', 'muskmelon')
 
 def play_hangman():
     # Choose a random fruit from the list
@@ -30,6 +34,10 @@ def play_hangman():
     word_set = set(word)
     # Create a set for the letters guessed by the player
     guessed_set = set()
+    # Keep the displayed word as a list so only matching positions are updated
+    display = ['_'] * len(word)
+    # Count the distinct letters still to be found so the win check is O(1)
+    letters_left = len(word_set)
     # Calculate the number of remaining chances the player has
     remaining_chances = len(word) + 2
 
@@ -50,8 +58,8 @@ def play_hangman():
             print("\nBye! Try again.")
             return
 
-        # Validate the player's guess
-        if len(guess) != 1 or not guess.isalpha():
+        # Validate the player's guess (one lookup covers length and alphabet)
+        if guess not in LETTERS:
             print("Enter only a single letter!")
             continue
 
@@ -65,6 +73,11 @@ def play_hangman():
         # Check if the guess is in the word
         if guess in word_set:
             print("Correct!")
+            # Reveal every position of the guessed letter
+            for i, char in enumerate(word):
+                if char == guess:
+                    display[i] = char
+            letters_left -= 1
         else:
             print("Incorrect!")
             if remaining_chances == 0:
@@ -73,15 +86,9 @@ def play_hangman():
                 return
 
         # Print the current state of the word
-        correct = 0
-        for i, char in enumerate(word):
-            if char in guessed_set:
-                print(char, end=' ')
-                correct += 1
-            else:
-                print('_', end=' ')
-
-        if correct == len(word):
+        print(' '.join(display), end=' ')
+
+        if letters_left == 0:
             # The player has correctly guessed all letters in the word
             print(f"\nThe word is: {word}")
             print("Congratulations, you won!")
@@ -6,7 +6,7 @@ It imports necessary modules such as PyQt5 and os. It defines a main window clas
 In the constructor of the MainWindow class, it sets the window title and size, creates a central widget, creates a "Browse Image" button, a QLabel 
 for displaying the selected image, a QLabel for "Img-Display-GUI" text, a QLabel for displaying the selected file name, a QTextEdit for displaying 
 the selected file name, and a status bar.
-It defines a function called load_image which opens a file dialog to select an image file, displays the selected image in the QLabel, displays the 
+It defines a function called load_image which opens a file dialog to select an image file, loads the selected image scaled to the size of the QLabel and displays it there, displays the 
 selected file name in the QTextEdit, and stores the selected file name in a variable called self.file.
 It runs the application by creating an instance of QApplication, an instance of MainWindow, and calling the show method to display the main window. Finally, it calls the exec_ method of the application instance to start the event loop. """
 
@@ -76,9 +76,17 @@ class MainWindow(QtWidgets.QMainWindow):
             print(file_name)
             self.file = file_name
 
-            # Creating pixmap from selected image file and scaling it to fit label
-            pixmap = QtGui.QPixmap(file_name)
-            pixmap = pixmap.scaled(self.image_lbl.width(), self.image_lbl.height(), QtCore.Qt.KeepAspectRatio)
+            # Asking the reader for an image at the label size; JPEG decodes at reduced size, while PNG and BMP
+            # are decoded at full size and then scaled by the reader
+            reader = QtGui.QImageReader(file_name)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(self.image_lbl.width(), self.image_lbl.height(), QtCore.Qt.KeepAspectRatio))
+                pixmap = QtGui.QPixmap.fromImage(reader.read())
+            else:
+                # The size is unknown before decoding, so scale the pixmap to fit the label afterwards
+                pixmap = QtGui.QPixmap.fromImage(reader.read())
+                pixmap = pixmap.scaled(self.image_lbl.width(), self.image_lbl.height(), QtCore.Qt.KeepAspectRatio)
             self.image_lbl.setPixmap(pixmap)
 
             # Displaying only the file name in the text edit
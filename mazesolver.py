@@ -1,11 +1,11 @@
 """ 
-This code solves a maze problem using a recursive backtracking algorithm. The maze is defined as a 2D array of 0s and 1s, where 0s represent open paths and 1s represent walls. The goal is to find a path from the top-left 
+This code solves a maze problem using a backtracking algorithm driven by an explicit stack. The maze is defined as a 2D array of 0s and 1s, where 0s represent open paths and 1s represent walls. The goal is to find a path from the top-left 
 corner of the maze to the bottom-right corner.
 
 The algorithm works as follows:
 
-Starting from the top-left corner of the maze, the function explore_maze() recursively explores the adjacent cells to find a path to the 
-bottom-right corner.
+Starting from the top-left corner of the maze, the function explore_maze() explores the adjacent cells to find a path to the 
+bottom-right corner, keeping the cells of the current path on a stack rather than in recursive calls.
 
 If a cell is found to be part of the solution path, it is marked as such in the solution array. If no solution is found from the current cell, it is marked as not part of the solution path and the algorithm backtracks to the previous cell to 
 try another path.
@@ -27,31 +27,45 @@ maze = [
 # Create a solution array to keep track of the path
 solution = [[0]*SIZE for i in range(SIZE)]
 
-# Define the recursive function to explore the maze
+# Order in which the adjacent cells are explored: down, right, up, left
+DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+# Define the function to explore the maze using an explicit stack instead of recursion
 def explore_maze(row, col):
-    # Check if the current cell is the end of the maze
-    if (row == SIZE-1) and (col == SIZE-1):
-        solution[row][col] = 1;
-        return True;
-    # Check if the current cell is within the bounds of the maze and has not been visited before
-    if row >= 0 and col >= 0 and row < SIZE and col < SIZE and solution[row][col] == 0 and maze[row][col] == 0:
-        # Mark the current cell as part of the solution
-        solution[row][col] = 1
-        # Print the current cell being explored
-        print(f"Exploring cell ({row}, {col})")
-        # Recursively explore the adjacent cells
-        if explore_maze(row+1, col) or explore_maze(row, col+1) or explore_maze(row-1, col) or explore_maze(row, col-1):
+    # Each stack entry holds a cell on the current path and the index of the next direction to try
+    stack = []
+
+    while True:
+        # Check if the current cell is the end of the maze
+        if (row == SIZE-1) and (col == SIZE-1):
+            solution[row][col] = 1
             return True
-        # If no solution is found, mark the current cell as not part of the solution
-        solution[row][col] = 0;
-        return False;
-    return 0;
+        # Check if the current cell is within the bounds of the maze and has not been visited before
+        if row >= 0 and col >= 0 and row < SIZE and col < SIZE and solution[row][col] == 0 and maze[row][col] == 0:
+            # Mark the current cell as part of the solution
+            solution[row][col] = 1
+            # Print the current cell being explored
+            print(f"Exploring cell ({row}, {col})")
+            stack.append([row, col, 0])
+
+        # Backtrack from cells whose adjacent cells have all been tried
+        while stack and stack[-1][2] == len(DIRECTIONS):
+            # If no solution is found, mark the cell as not part of the solution
+            r, c, _ = stack.pop()
+            solution[r][c] = 0
+        if not stack:
+            return False
+
+        # Move on to the next adjacent cell of the cell on top of the stack
+        top = stack[-1]
+        d_row, d_col = DIRECTIONS[top[2]]
+        top[2] += 1
+        row, col = top[0] + d_row, top[1] + d_col
 
 # Call the explore_maze function starting from the top-left cell
 if explore_maze(0,0):
-    # If a solution is found, print the solution array
-    for i in solution:
-        print (i)
+    # If a solution is found, print the solution array with a single print call
+    print("\n".join(str(i) for i in solution))
 else:
     # If no solution is found, print an error message
     print ("No solution")
\ No newline at end of file
@@ -9,7 +9,7 @@ When the "view" option is selected, the program opens the passwords.txt file in
 the program splits the line into the username and encrypted password, decrypts the password using the loaded encryption key, and prints the 
 username and password.
 
-When the "add" option is selected, the program prompts the user for an account name and password, encrypts the password using the loaded 
+When the "add" option is selected, the program prompts the user for an account name and password (without echoing it), encrypts the password using the loaded 
 encryption key, and appends the account name and encrypted password to the passwords.txt file.
 
 The program also includes functions to generate a new encryption key and load the encryption key from a file. The program checks whether the key 
@@ -18,12 +18,15 @@ file exists and generates a new key if it does not exist, or loads the key from
 The program runs in an infinite loop until the user chooses to quit by entering 'q'.
 """
 
-# Import the Fernet class from the cryptography library
-from cryptography.fernet import Fernet
+# Import the Fernet class and its decryption error from the cryptography library
+from cryptography.fernet import Fernet, InvalidToken
 
 # Import the os module to work with the file system
 import os
 
+# Import getpass to read passwords without echoing them to the terminal
+from getpass import getpass
+
 
 # Function to generate a new encryption key and save it to a file
 def write_key():
@@ -54,8 +57,8 @@ def view():
                     # Decrypt the password using the loaded encryption key and print the username and password
                     print("User:", user, "| Password:",
                           fer.decrypt(passw.encode()).decode())
-                except:
-                    # If there is an error decrypting the password, print an error message
+                except InvalidToken:
+                    # If the token is corrupt or was encrypted with another key, print an error message
                     print("Error decrypting password:", passw)
     except FileNotFoundError:
         # If the passwords file is not found, print an error message
@@ -66,7 +69,7 @@ def view():
 def add():
     # Prompt the user for the account name and password
     name = input('Account Name: ')
-    pwd = input("Password: ")
+    pwd = getpass("Password: ")
 
     # Open the passwords file in append mode and write the account name and encrypted password
     with open('passwords.txt', 'a') as f:
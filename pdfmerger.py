@@ -4,7 +4,8 @@ This code uses the Python library PyPDF2 to merge multiple PDF files into a sing
 PyPDF2 is a pure-python PDF library that allows manipulation of PDFs, including merging, splitting, cropping, and transforming pages. It is built 
 on top of the lower-level PDFMiner library and provides a high-level interface for working with PDF documents.
 
-First, a list of PDF file names is created. Then, a PdfMerger object is initialized from PyPDF2.
+The merge is done by the merge_pdfs() function, which runs on the sample files only when the script is executed directly. First, a list of PDF 
+file names is created. Then, a PdfMerger object is initialized from PyPDF2.
 
 A for loop iterates over each file name in the list. For each file, the code opens the file using open function in "rb" (read binary) mode and 
 creates a PdfReader object using PyPDF2.
@@ -18,17 +19,23 @@ After the loop is complete, the code closes the PDF files and writes the merged
 # Import necessary modules
 import PyPDF2
 
-# List of PDF files to merge
-pdfiles = ["doc/1.pdf", "doc/2.pdf"]
+# Merge the given PDF files, in order, into a single output file
+def merge_pdfs(pdfiles, output):
+    # Create PdfMerger object
+    merger = PyPDF2.PdfMerger()
 
-# Create PdfMerger object
-merger = PyPDF2.PdfMerger()
+    # Loop through PDF files and append them to merger object
+    for filename in pdfiles:
+        with open(filename, 'rb') as pdfFile:
+            merger.append(PyPDF2.PdfReader(pdfFile))
 
-# Loop through PDF files and append them to merger object
-for filename in pdfiles:
-    with open(filename, 'rb') as pdfFile:
-        merger.append(PyPDF2.PdfReader(pdfFile))
+    # Write merged PDF file to disk
+    with open(output, 'wb') as mergedPdf:
+        merger.write(mergedPdf)
 
-# Write merged PDF file to disk
-with open('doc/merged.pdf', 'wb') as mergedPdf:
-    merger.write(mergedPdf)
\ No newline at end of file
+
+# Only merge the sample files when run as a script, not on import
+if __name__ == '__main__':
+    # List of PDF files to merge
+    pdfiles = ["doc/1.pdf", "doc/2.pdf"]
+    merge_pdfs(pdfiles, 'doc/merged.pdf')
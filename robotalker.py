@@ -3,15 +3,15 @@ This code is a Python script that uses the subprocess module to call the wsay co
 
 It first welcomes the user to the program, then enters into an infinite loop that prompts the user to enter a phrase to be spoken. If the user 
 inputs "q", the program uses subprocess.run() to call wsay and speak "bye, nice talking to you" before exiting the loop and terminating the 
-program. If the user inputs any other phrase, the program constructs a command string using the f-string syntax with the input phrase as an 
-argument to wsay, and then calls the subprocess.run() function to execute the command and speak the input phrase.
+program. If the user inputs any other phrase, the program passes wsay and the input phrase as an argument list to the subprocess.run() function 
+to execute the command and speak the input phrase.
 
 wsay is a command-line tool on Windows (https://github.com/p-groarke/wsay/releases) that is used to speak out loud the input text using the 
 system's built-in text-to-speech functionality. When wsay is called with a string argument, it converts the string to speech and speaks it out 
 loud through the system's audio output.
 
-In the code provided, the subprocess module is used to call wsay with the user's input phrase and speak it out loud. The shell=True argument in 
-the subprocess.run() function is used to execute the wsay command in a shell environment so that the wsay program is recognized as a command.
+In the code provided, the subprocess module is used to call wsay with the user's input phrase and speak it out loud. wsay is started directly 
+rather than through a shell, so no extra shell process is spawned for each phrase and quotes in the phrase cannot break the command.
 """
 
 # Import necessary modules
@@ -29,6 +29,5 @@ if __name__ == '__main__':
             subprocess.run(['wsay', 'bye, nice talking to you'])
             break
 
-        # Speak the user's input
-        command = f'wsay "{phrase}"'
-        subprocess.run(command, shell=True)
+        # Speak the user's input, launching wsay directly rather than through a shell
+        subprocess.run(['wsay', phrase])